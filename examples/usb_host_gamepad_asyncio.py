@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Cooper Dalrymple
+#
+# SPDX-License-Identifier: Unlicense
+#
+# Tested on Fruit Jam RP2350b
+# Install prerequisites: circup install asyncio neopixel
+import asyncio
+
+import board
+import displayio
+from neopixel import NeoPixel
+
+import relic_usb_host_gamepad
+
+DEBUG = False
+
+# disable REPL display output for better performance
+displayio.release_displays()
+
+neopixels = NeoPixel(board.NEOPIXEL, 5, auto_write=False)
+neopixels.fill(0x000000)
+neopixels.show()
+
+
+async def gamepad_task(gamepad: relic_usb_host_gamepad.Gamepad, index: int) -> None:
+    while True:
+        # each update performs at most one short usb transfer, so yield after every poll to let
+        # other tasks run between reads
+        if gamepad.update() and gamepad.buttons.changed:
+            for event in gamepad.buttons.events:
+                print(
+                    "Gamepad {:d}: {:s} {:s}".format(
+                        index + 1,
+                        relic_usb_host_gamepad.BUTTON_NAMES[event.key_number],
+                        ("Pressed" if event.pressed else "Released"),
+                    )
+                )
+        await asyncio.sleep(0)
+
+
+async def led_task(gamepads: list) -> None:
+    while True:
+        for i, gamepad in enumerate(gamepads):
+            for j, pressed in enumerate((gamepad.buttons.A, gamepad.buttons.B)):
+                neopixels[i * len(gamepads) + j] = 0xFFFFFF if pressed else 0x000000
+        neopixels.show()
+        await asyncio.sleep(1 / 60)
+
+
+async def main() -> None:
+    # create gamepad objects for ports 1 and 2 which poll at the interval of each device
+    gamepads = [relic_usb_host_gamepad.Gamepad(i + 1, debug=DEBUG) for i in range(2)]
+    await asyncio.gather(
+        *(gamepad_task(gamepad, i) for i, gamepad in enumerate(gamepads)),
+        led_task(gamepads),
+    )
+
+
+asyncio.run(main())
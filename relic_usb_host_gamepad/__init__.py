@@ -44,12 +44,20 @@ from relic_usb_host_descriptor_parser import DeviceDescriptor
 from usb.util import SPEED_HIGH
 
 _MAX_TIMEOUTS = const(99)
+_BUTTON_NONE = const(0xFF)
 _SEARCH_DELAY = const(1)
+_IDLE_DELAY_NS = const(500000000)  # 500 ms without report changes
+_IDLE_INTERVAL_NS = const(20000000)  # 20 ms
+_XINPUT_JITTER = const(512)
 _DEFAULT_TRIGGER_THRESHOLD = 0.5
 _DEFAULT_JOYSTICK_THRESHOLD = 0.25
 _DEFAULT_JOYSTICK_DEADZONE = 0.1
 _DS4_COLORS = (0xFFFFFF, 0x0000FF, 0xFF0000, 0x00FF00, 0xFF00FF)
 
+# 4-bit hat switch value => d-pad directions (bit 0 = up, 1 = right, 2 = down, 3 = left)
+# values 8-15 are treated as neutral
+_DPAD_LUT = bytes((0x01, 0x03, 0x02, 0x06, 0x04, 0x0C, 0x08, 0x09, 0, 0, 0, 0, 0, 0, 0, 0))
+
 # USB detected device types
 
 DEVICE_TYPE_UNKNOWN = const(0)
@@ -81,28 +89,27 @@ DEVICE_TYPE_HID_JOYSTICK = const(7)  # (vid:pid vary) Various USB HID Joysticks
 """
 
 
-_DEVICE_TYPES = (
-    # (index, vid, pid),
-    (DEVICE_TYPE_SWITCH_PRO, 0x057E, 0x2009),
-    (DEVICE_TYPE_ADAFRUIT_SNES, 0x081F, 0xE401),
-    (DEVICE_TYPE_8BITDO_ZERO2, 0x2DC8, 0x9018),
-    (DEVICE_TYPE_POWERA_WIRED, 0x20D6, 0xA711),
-    (DEVICE_TYPE_PLAYSTATION_DS4, 0x054C, 0x09CC),
-)
+_DEVICE_TYPES = {
+    # (vid, pid): index,
+    (0x057E, 0x2009): DEVICE_TYPE_SWITCH_PRO,
+    (0x081F, 0xE401): DEVICE_TYPE_ADAFRUIT_SNES,
+    (0x2DC8, 0x9018): DEVICE_TYPE_8BITDO_ZERO2,
+    (0x20D6, 0xA711): DEVICE_TYPE_POWERA_WIRED,
+    (0x054C, 0x09CC): DEVICE_TYPE_PLAYSTATION_DS4,
+}
 
-_DEVICE_CLASSES = (
-    # (index, device class, device subclass, interface 0 class, interface 0 subclass),
-    (DEVICE_TYPE_XINPUT, 0xFF, 0xFF, 0xFF, 0x5D),
-)
+_DEVICE_CLASSES = {
+    # (device class, device subclass, interface 0 class, interface 0 subclass): index,
+    (0xFF, 0xFF, 0xFF, 0x5D): DEVICE_TYPE_XINPUT,
+}
 
-_DEVICE_HID_USAGES = (
-    # (index, usage page id, usage id),
+_DEVICE_HID_USAGES = {
+    # (usage page id, usage id): index,
     (
-        DEVICE_TYPE_HID_JOYSTICK,
         adafruit_usb_host_descriptors.USAGE_PAGE_GENERIC_DESKTOP,
         adafruit_usb_host_descriptors.USAGE_JOYSTICK,
-    ),
-)
+    ): DEVICE_TYPE_HID_JOYSTICK,
+}
 
 DEVICE_NAMES = (
     "Unknown",
@@ -260,6 +267,218 @@ DUALSHOCK 4 controllers. Used as the :attr:`keypad.Event.key_number` attribute i
 :attr:`Gamepad.events`.
 """
 
+# report byte layouts: button id of each bit from lsb to msb, _BUTTON_NONE if unused
+
+_DPAD_BUTTONS = bytes(
+    (
+        BUTTON_UP,  # d-pad lookup table bits
+        BUTTON_RIGHT,
+        BUTTON_DOWN,
+        BUTTON_LEFT,
+    )
+)
+
+_SWITCH_PRO_BUTTONS_2 = bytes(
+    (
+        BUTTON_Y,
+        BUTTON_X,
+        BUTTON_B,
+        BUTTON_A,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_R1,
+        _BUTTON_NONE,
+    )
+)
+
+_SWITCH_PRO_BUTTONS_3 = bytes(
+    (
+        BUTTON_SELECT,
+        BUTTON_START,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_SWITCH_PRO_BUTTONS_4 = bytes(
+    (
+        BUTTON_DOWN,
+        BUTTON_UP,
+        BUTTON_RIGHT,
+        BUTTON_LEFT,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_L1,
+        _BUTTON_NONE,
+    )
+)
+
+_XINPUT_BUTTONS_2 = bytes(
+    (
+        BUTTON_UP,
+        BUTTON_DOWN,
+        BUTTON_LEFT,
+        BUTTON_RIGHT,
+        BUTTON_START,
+        BUTTON_SELECT,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_XINPUT_BUTTONS_3 = bytes(
+    (
+        BUTTON_L1,
+        BUTTON_R1,
+        BUTTON_HOME,
+        _BUTTON_NONE,
+        BUTTON_B,
+        BUTTON_A,
+        BUTTON_Y,
+        BUTTON_X,
+    )
+)
+
+_ADAFRUIT_SNES_BUTTONS_5 = bytes(
+    (
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_X,
+        BUTTON_A,
+        BUTTON_B,
+        BUTTON_Y,
+    )
+)
+
+_ADAFRUIT_SNES_BUTTONS_6 = bytes(
+    (
+        BUTTON_L1,
+        BUTTON_R1,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_SELECT,
+        BUTTON_START,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_ZERO2_BUTTONS_0 = bytes(
+    (
+        BUTTON_A,
+        BUTTON_B,
+        _BUTTON_NONE,
+        BUTTON_X,
+        BUTTON_Y,
+        _BUTTON_NONE,
+        BUTTON_L1,
+        BUTTON_R1,
+    )
+)
+
+_ZERO2_BUTTONS_1 = bytes(
+    (
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_SELECT,
+        BUTTON_START,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_POWERA_WIRED_BUTTONS_0 = bytes(
+    (
+        BUTTON_Y,
+        BUTTON_B,
+        BUTTON_A,
+        BUTTON_X,
+        BUTTON_L1,
+        BUTTON_R1,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_POWERA_WIRED_BUTTONS_1 = bytes(
+    (
+        BUTTON_SELECT,
+        BUTTON_START,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_DS4_BUTTONS_5 = bytes(
+    (
+        _BUTTON_NONE,  # d-pad
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        BUTTON_X,  # Square
+        BUTTON_A,  # X
+        BUTTON_B,  # Circle
+        BUTTON_Y,  # Triangle
+    )
+)
+
+_DS4_BUTTONS_6 = bytes(
+    (
+        BUTTON_L1,
+        BUTTON_R1,
+        _BUTTON_NONE,  # L2, handled by analog trigger values
+        _BUTTON_NONE,  # R2
+        BUTTON_SELECT,  # Share
+        BUTTON_START,  # Options
+        BUTTON_L3,
+        BUTTON_R3,
+    )
+)
+
+_DS4_BUTTONS_7 = bytes(
+    (
+        BUTTON_HOME,  # PS
+        BUTTON_TOUCH_PAD,  # Touch Pad
+        _BUTTON_NONE,  # frame counter
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+        _BUTTON_NONE,
+    )
+)
+
+_HID_JOYSTICK_BUTTONS_8 = bytes(
+    (
+        BUTTON_R1,  # button 1 (trigger)
+        BUTTON_L1,  # button 2
+        BUTTON_SELECT,  # button 3
+        BUTTON_START,  # button 4
+        BUTTON_A,  # button 5
+        BUTTON_X,  # button 6
+        BUTTON_Y,  # button 7
+        BUTTON_B,  # button 8
+    )
+)
+
+# button ID => button mask
+_BUTTON_MASKS = tuple(1 << i for i in range(len(BUTTON_NAMES)))
+
+# button mask => button ID
+_BUTTON_IDS = {mask: i for i, mask in enumerate(_BUTTON_MASKS)}
+
 
 class Button:
     def __init__(self, index: int):
@@ -269,15 +488,8 @@ class Button:
         return bool(obj._pressed & self._mask)
 
     def __set__(self, obj, value: bool):
-        if bool(obj._pressed & self._mask) != value:
-            obj._changed |= self._mask
-        else:
-            obj._changed &= ~self._mask
-
-        if value:
-            obj._pressed |= self._mask
-        else:
-            obj._pressed &= ~self._mask
+        mask = self._mask
+        obj._apply_mask(mask, mask if value else 0)
 
 
 class Buttons:
@@ -364,14 +576,16 @@ class Buttons:
         self.reset()
 
     def __iter__(self):
-        for x in BUTTON_NAMES:
-            yield getattr(self, x)
+        pressed = self._pressed
+        for mask in _BUTTON_MASKS:
+            yield bool(pressed & mask)
 
     def __getitem__(self, index: int) -> bool:
-        return getattr(self, BUTTON_NAMES[index])
+        return bool(self._pressed & _BUTTON_MASKS[index])
 
     def __setitem__(self, index: int, value: bool) -> None:
-        setattr(self, BUTTON_NAMES[index], value)
+        mask = _BUTTON_MASKS[index]
+        self._apply_mask(mask, mask if value else 0)
 
     def __len__(self) -> int:
         return len(BUTTON_NAMES)
@@ -382,7 +596,20 @@ class Buttons:
         represented as :class:`keypad.Event` objects. The :attr:`keypad.Event.key_number` value
         represents the button ID.
         """
-        return tuple([keypad.Event(i, x) for i, x in enumerate(self) if self._changed & (1 << i)])
+        if not (changed := self._changed):
+            return ()
+
+        if not changed & (changed - 1):
+            # a single button changed, build the tuple directly
+            return (keypad.Event(_BUTTON_IDS[changed], bool(self._pressed & changed)),)
+
+        events = []
+        while changed:
+            # only visit the set bits, lowest first
+            lsb = changed & -changed
+            events.append(keypad.Event(_BUTTON_IDS[lsb], bool(self._pressed & lsb)))
+            changed ^= lsb
+        return tuple(events)
 
     @property
     def changed(self) -> bool:
@@ -401,6 +628,27 @@ class Buttons:
         self._pressed = 0
         self._changed = 0
 
+    def _apply_byte(self, value: int, previous: int, layout: bytes) -> None:
+        # only visit the bits which differ from the previous report
+        diff = value ^ previous
+        i = 0
+        while diff:
+            if diff & 1 and (index := layout[i]) != _BUTTON_NONE:
+                mask = 1 << index
+                self._changed |= mask
+                if value & (1 << i):
+                    self._pressed |= mask
+                else:
+                    self._pressed &= ~mask
+            diff >>= 1
+            i += 1
+
+    def _apply_mask(self, mask: int, value: int) -> None:
+        # update every button within mask at once using the matching bits of value
+        diff = (self._pressed ^ value) & mask
+        self._changed |= diff
+        self._pressed ^= diff
+
 
 class State:
     left_joystick_invert_x: bool = False
@@ -455,10 +703,11 @@ class State:
 
     @left_trigger.setter
     def left_trigger(self, value: int | float) -> None:
-        if type(value) is float:
-            value = int(value * 255)
-        self._left_trigger = min(max(value, 0), 255)
-        self._buttons.L2 = self._left_trigger >= self._trigger_threshold
+        self._set_left_trigger(int(value * 255) if type(value) is float else value)
+
+    def _set_left_trigger(self, value: int) -> None:
+        self._left_trigger = value = 0 if value < 0 else (255 if value > 255 else value)
+        self._buttons._apply_mask(1 << BUTTON_L2, (value >= self._trigger_threshold) << BUTTON_L2)
 
     @property
     def right_trigger(self) -> float:
@@ -466,17 +715,16 @@ class State:
 
     @right_trigger.setter
     def right_trigger(self, value: int | float) -> None:
-        if type(value) is float:
-            value = int(value * 255)
-        self._right_trigger = min(max(value, 0), 255)
-        self._buttons.R2 = self._right_trigger >= self._trigger_threshold
+        self._set_right_trigger(int(value * 255) if type(value) is float else value)
 
-    def _apply_deadzone(self, value: int | float, invert: bool = False) -> tuple[int]:
-        if type(value) is float:
-            value = int(value * 32767)
+    def _set_right_trigger(self, value: int) -> None:
+        self._right_trigger = value = 0 if value < 0 else (255 if value > 255 else value)
+        self._buttons._apply_mask(1 << BUTTON_R2, (value >= self._trigger_threshold) << BUTTON_R2)
+
+    def _apply_deadzone(self, value: int, invert: bool = False) -> tuple[int]:
         if invert:
-            value *= -1
-        raw_value = value = min(max(value, -32767), 32767)
+            value = -value
+        raw_value = value = -32767 if value < -32767 else (32767 if value > 32767 else value)
 
         if value > self._joystick_deadzone:
             value = int(
@@ -499,14 +747,27 @@ class State:
     def left_joystick(self, value: tuple[int | float]) -> None:
         if len(value) != 2:
             raise ValueError("value must be in the format of (x, y)")
+        x, y = value
+        self._set_left_joystick(
+            int(x * 32767) if type(x) is float else x,
+            int(y * 32767) if type(y) is float else y,
+        )
 
-        x, self._left_joystick_x = self._apply_deadzone(value[0], self.left_joystick_invert_x)
-        y, self._left_joystick_y = self._apply_deadzone(value[1], self.left_joystick_invert_y)
-
-        self._buttons.JOYSTICK_RIGHT = x >= self._joystick_threshold
-        self._buttons.JOYSTICK_LEFT = x <= -self._joystick_threshold
-        self._buttons.JOYSTICK_UP = y >= self._joystick_threshold
-        self._buttons.JOYSTICK_DOWN = y <= -self._joystick_threshold
+    def _set_left_joystick(self, x: int, y: int) -> None:
+        x, self._left_joystick_x = self._apply_deadzone(x, self.left_joystick_invert_x)
+        y, self._left_joystick_y = self._apply_deadzone(y, self.left_joystick_invert_y)
+
+        threshold = self._joystick_threshold
+        self._buttons._apply_mask(
+            (1 << BUTTON_JOYSTICK_RIGHT)
+            | (1 << BUTTON_JOYSTICK_LEFT)
+            | (1 << BUTTON_JOYSTICK_UP)
+            | (1 << BUTTON_JOYSTICK_DOWN),
+            ((x >= threshold) << BUTTON_JOYSTICK_RIGHT)
+            | ((x <= -threshold) << BUTTON_JOYSTICK_LEFT)
+            | ((y >= threshold) << BUTTON_JOYSTICK_UP)
+            | ((y <= -threshold) << BUTTON_JOYSTICK_DOWN),
+        )
 
     @property
     def right_joystick(self) -> tuple[float]:
@@ -516,9 +777,15 @@ class State:
     def right_joystick(self, value: tuple[int | float]) -> None:
         if len(value) != 2:
             raise ValueError("value must be in the format of (x, y)")
+        x, y = value
+        self._set_right_joystick(
+            int(x * 32767) if type(x) is float else x,
+            int(y * 32767) if type(y) is float else y,
+        )
 
-        self._right_joystick_x = self._apply_deadzone(value[0], self.right_joystick_invert_x)[1]
-        self._right_joystick_y = self._apply_deadzone(value[1], self.right_joystick_invert_y)[1]
+    def _set_right_joystick(self, x: int, y: int) -> None:
+        self._right_joystick_x = self._apply_deadzone(x, self.right_joystick_invert_x)[1]
+        self._right_joystick_y = self._apply_deadzone(y, self.right_joystick_invert_y)[1]
 
     def reset(self) -> None:
         self._buttons.reset()
@@ -537,11 +804,10 @@ def _get_device_type(  # noqa: PLR0912
     device_id = (device.idVendor, device.idProduct)
     if debug:
         print("identifying device by id (vid+pid):", [hex(x) for x in device_id])
-    for device_type, type_vid, type_pid in _DEVICE_TYPES:
-        if device_id == (type_vid, type_pid):
-            if debug:
-                print("found device type:", device_type)
-            return device_type
+    if (device_type := _DEVICE_TYPES.get(device_id)) is not None:
+        if debug:
+            print("found device type:", device_type)
+        return device_type
 
     if device_descriptor is None:
         device_descriptor = DeviceDescriptor(device)
@@ -562,43 +828,59 @@ def _get_device_type(  # noqa: PLR0912
                 "identifying device by hid usage identifier:",
                 [hex(x) for x in usage_identifier],
             )
-        for device_type, usage_page_id, usage_id in _DEVICE_HID_USAGES:
-            if usage_identifier == (usage_page_id, usage_id):
-                if debug:
-                    print("found device type:", device_type)
-                return device_type
+        if (device_type := _DEVICE_HID_USAGES.get(usage_identifier)) is not None:
+            if debug:
+                print("found device type:", device_type)
+            return device_type
 
     # identify device by class
     if debug:
         print("identifying device by class identifier:", [hex(x) for x in class_identifier])
-    for (
-        device_type,
-        type_class,
-        type_subclass,
-        type_int_class,
-        type_int_subclass,
-    ) in _DEVICE_CLASSES:
-        if class_identifier == (type_class, type_subclass, type_int_class, type_int_subclass):
-            if debug:
-                print("found device type:", device_type)
-            return device_type
+    if (device_type := _DEVICE_CLASSES.get(tuple(class_identifier))) is not None:
+        if debug:
+            print("found device type:", device_type)
+        return device_type
 
     return DEVICE_TYPE_UNKNOWN
 
 
 def _report_equals(a: bytearray, b: bytearray, length: int = None) -> bool:
-    if a is None and b is not None or b is None and a is not None:
-        return False
+    if a is None or b is None:
+        return a is b
 
+    # compare within C, only slicing when part of the buffers is used
     if length is None:
         length = min(len(a), len(b))
-    for i in range(length):
-        if a[i] != b[i]:
-            return False
-    return True
+    if length == len(a) == len(b):
+        return a == b
+    return memoryview(a)[:length] == memoryview(b)[:length]
+
+
+# report buffers of disconnected devices which can be reused to avoid heap fragmentation
+_report_buffers = []
+_MAX_REPORT_BUFFERS = const(4)
+
+
+def _allocate_report(size: int) -> bytearray:
+    for i, buffer in enumerate(_report_buffers):
+        if len(buffer) == size:
+            del _report_buffers[i]
+            for j in range(size):
+                buffer[j] = 0
+            return buffer
+    return bytearray(size)
 
 
 class Device:
+    # (report byte index, button layout) of each byte of digital buttons
+    _BUTTON_LAYOUTS = ()
+
+    # report byte index of the 4-bit hat switch used for the d-pad, if any
+    _DPAD_INDEX = None
+
+    # size of a complete input report, shorter packets are status messages, if known
+    _REPORT_SIZE = None
+
     def __init__(  # noqa: PLR0913, PLR0917
         self,
         device: usb.core.Device,
@@ -613,15 +895,17 @@ class Device:
         self._led = 0
         self._debug = debug
 
-        self._descriptor = (
-            DeviceDescriptor(device) if device_descriptor is None else device_descriptor
-        )
-        self._configuration = self._descriptor.configurations[configuration]
-        self._interface = self._configuration.interfaces[interface]
-        self._in_endpoint = self._interface.in_endpoint
-        self._out_endpoint = self._interface.out_endpoint
-        if self._in_endpoint is None and self._out_endpoint is None:
+        # only keep the endpoint values which are needed, the descriptor tree is discarded
+        if device_descriptor is None:
+            device_descriptor = DeviceDescriptor(device)
+        configuration_descriptor = device_descriptor.configurations[configuration]
+        interface_descriptor = configuration_descriptor.interfaces[interface]
+        in_endpoint = interface_descriptor.in_endpoint
+        out_endpoint = interface_descriptor.out_endpoint
+        if in_endpoint is None and out_endpoint is None:
             raise ValueError("invalid interface endpoints")
+        self._in_address = in_endpoint.address if in_endpoint is not None else None
+        self._out_address = out_endpoint.address if out_endpoint is not None else None
 
         # make sure CircuitPython core is not claiming the device
         if device.is_kernel_driver_active(interface):
@@ -631,28 +915,30 @@ class Device:
 
         # set configuration
         if self._debug:
-            print("set configuration:", self._configuration.value)
-        device.set_configuration(self._configuration.value)
+            print("set configuration:", configuration_descriptor.value)
+        device.set_configuration(configuration_descriptor.value)
 
+        # reports are only ever read from the in endpoint, writes use the caller's buffer
         self._max_packet_size = min(
-            64,
-            max(
-                self._in_endpoint.max_packet_size if self._in_endpoint is not None else 0,
-                self._out_endpoint.max_packet_size if self._out_endpoint is not None else 0,
-            ),
+            64, in_endpoint.max_packet_size if in_endpoint is not None else 0
         )
-        self._report = bytearray(self._max_packet_size)
-        self._previous_report = bytearray(self._max_packet_size)
+        self._report = _allocate_report(self._max_packet_size)
+        self._previous_report = _allocate_report(self._max_packet_size)
+        if self._DPAD_INDEX is not None and self._DPAD_INDEX < len(self._previous_report):
+            self._previous_report[self._DPAD_INDEX] = 0x08  # neutral hat switch
 
         # Low-speed & Full-speed: max time between polling requests = interval * 1 ms
         # High-speed: max time between polling requests = math.pow(2, bInterval-1) * 125 µs
         self._interval = max(
-            self._in_endpoint.interval if self._in_endpoint is not None else 0,
-            self._out_endpoint.interval if self._out_endpoint is not None else 0,
+            in_endpoint.interval if in_endpoint is not None else 0,
+            out_endpoint.interval if out_endpoint is not None else 0,
         )
         if device.speed == SPEED_HIGH:
             self._interval = (2 << (self._interval - 1)) >> 3
-        self._timestamp = time.monotonic()
+        # transfers wait at least 1 ms, high-speed intervals below 8 microframes round down to 0
+        self._timeout = max(1, self._interval)
+        self.poll_interval = self._interval
+        self._timestamp = self._changed_timestamp = time.monotonic_ns()
 
     @property
     def device_id(self) -> tuple:
@@ -662,6 +948,18 @@ class Device:
     def device_type(self) -> int:
         return self._device_type
 
+    @property
+    def poll_interval(self) -> int:
+        return self._interval_ns // 1000000
+
+    @poll_interval.setter
+    def poll_interval(self, value: int) -> None:
+        self._interval_ns = max(0, value) * 1000000
+        self._idle_interval_ns = max(
+            self._interval_ns, min(self._interval_ns * 4, _IDLE_INTERVAL_NS)
+        )
+        self._poll_interval_ns = self._interval_ns
+
     @property
     def led(self) -> int:
         return self._led
@@ -673,30 +971,52 @@ class Device:
         self._led = value
 
     def read_state(self, state: State) -> bool:
-        if (current_time := time.monotonic()) - self._timestamp < self._interval / 1000:
+        if (current_time := time.monotonic_ns()) - self._timestamp < self._poll_interval_ns:
             return False
         self._timestamp = current_time
 
-        packet_size = self.read()
+        try:
+            packet_size = self.read()
+        except usb.core.USBTimeoutError:
+            # devices which NAK while idle back off too, the caller still counts the timeout
+            if current_time - self._changed_timestamp >= _IDLE_DELAY_NS:
+                self._poll_interval_ns = self._idle_interval_ns
+            raise
         if not packet_size or _report_equals(self._report, self._previous_report, packet_size):
+            # back off polling while the device is idle
+            if current_time - self._changed_timestamp >= _IDLE_DELAY_NS:
+                self._poll_interval_ns = self._idle_interval_ns
             return False
-        self._previous_report = self._report[:]
+
+        self._changed_timestamp = current_time
+        self._poll_interval_ns = self._interval_ns
 
         if self._debug:
             print("report:", self._report[:packet_size])
 
         self._update_state(state)
+
+        # copy in place, bytes past a short packet must match the report they were decoded with
+        self._previous_report[:] = self._report
         return True
 
-    def _update_state(self) -> None:
-        pass
+    def _update_state(self, state: State) -> None:
+        r = self._report
+        p = self._previous_report
+        b = state.buttons
+
+        for index, layout in self._BUTTON_LAYOUTS:
+            b._apply_byte(r[index], p[index], layout)
+
+        if (index := self._DPAD_INDEX) is not None:
+            b._apply_byte(_DPAD_LUT[r[index] & 0x0F], _DPAD_LUT[p[index] & 0x0F], _DPAD_BUTTONS)
 
     def write(self, data: bytearray, acknowledge: bool = True) -> bool:
-        if self._out_endpoint is None:
+        if self._out_address is None:
             return False
 
         try:
-            self._device.write(self._out_endpoint.address, data, timeout=self._interval)
+            self._device.write(self._out_address, data, timeout=self._timeout)
             if not acknowledge:
                 return True
         except usb.core.USBTimeoutError:
@@ -713,20 +1033,35 @@ class Device:
 
     def read(self) -> int:
         return (
-            self._device.read(self._in_endpoint.address, self._report, timeout=self._interval)
-            if self._in_endpoint is not None
+            self._device.read(self._in_address, self._report, timeout=self._timeout)
+            if self._in_address is not None
             else 0
         )
 
+    def release(self) -> None:
+        for buffer in (self._report, self._previous_report):
+            if len(_report_buffers) < _MAX_REPORT_BUFFERS:
+                _report_buffers.append(buffer)
+        self._report = self._previous_report = None
+
     def flush(self) -> None:
+        # drain queued status packets, stopping at the first complete input report
+        report_size = self._REPORT_SIZE or len(self._report)
         for i in range(8):
             try:
-                self.read()
+                if self.read() >= report_size:
+                    return
             except usb.core.USBTimeoutError:
                 pass
 
 
 class SwitchProDevice(Device):
+    _BUTTON_LAYOUTS = (
+        (2, _SWITCH_PRO_BUTTONS_2),
+        (3, _SWITCH_PRO_BUTTONS_3),
+        (4, _SWITCH_PRO_BUTTONS_4),
+    )
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -767,22 +1102,14 @@ class SwitchProDevice(Device):
                 msg[len(msg) - 1] |= 1 << i
         self.write(msg)
 
-    def _update_state(self, state: State) -> None:
-        state.buttons.Y = bool(self._report[2] & 0x01)
-        state.buttons.X = bool(self._report[2] & 0x02)
-        state.buttons.B = bool(self._report[2] & 0x04)
-        state.buttons.A = bool(self._report[2] & 0x08)
-        state.buttons.R1 = bool(self._report[2] & 0x40)
-        state.buttons.SELECT = bool(self._report[3] & 0x01)
-        state.buttons.START = bool(self._report[3] & 0x02)
-        state.buttons.DOWN = bool(self._report[4] & 0x01)
-        state.buttons.UP = bool(self._report[4] & 0x02)
-        state.buttons.RIGHT = bool(self._report[4] & 0x04)
-        state.buttons.LEFT = bool(self._report[4] & 0x08)
-        state.buttons.L1 = bool(self._report[4] & 0x40)
-
 
 class XInputDevice(Device):
+    _BUTTON_LAYOUTS = (
+        (2, _XINPUT_BUTTONS_2),
+        (3, _XINPUT_BUTTONS_3),
+    )
+    _REPORT_SIZE = 20
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -809,35 +1136,40 @@ class XInputDevice(Device):
                 msg[len(msg) - 1] |= 1 << (1 - i)
         self.write(msg)
 
+    def read(self) -> int:
+        packet_size = super().read()
+        if packet_size >= 14 and (r := self._report)[0] == 0x00:
+            # snap resting stick jitter to zero so that idle reports compare as equal
+            left_x, left_y, right_x, right_y = struct.unpack_from("<hhhh", r, 6)
+            struct.pack_into(
+                "<hhhh",
+                r,
+                6,
+                0 if -_XINPUT_JITTER < left_x < _XINPUT_JITTER else left_x,
+                0 if -_XINPUT_JITTER < left_y < _XINPUT_JITTER else left_y,
+                0 if -_XINPUT_JITTER < right_x < _XINPUT_JITTER else right_x,
+                0 if -_XINPUT_JITTER < right_y < _XINPUT_JITTER else right_y,
+            )
+        return packet_size
+
     def _update_state(self, state: State) -> None:
-        state.buttons.UP = bool(self._report[2] & 0x01)
-        state.buttons.DOWN = bool(self._report[2] & 0x02)
-        state.buttons.LEFT = bool(self._report[2] & 0x04)
-        state.buttons.RIGHT = bool(self._report[2] & 0x08)
-        state.buttons.START = bool(self._report[2] & 0x10)
-        state.buttons.SELECT = bool(self._report[2] & 0x20)
-        state.buttons.L1 = bool(self._report[3] & 0x01)
-        state.buttons.R1 = bool(self._report[3] & 0x02)
-        state.buttons.HOME = bool(self._report[3] & 0x04)
-        state.buttons.B = bool(self._report[3] & 0x10)
-        state.buttons.A = bool(self._report[3] & 0x20)
-        state.buttons.Y = bool(self._report[3] & 0x40)
-        state.buttons.X = bool(self._report[3] & 0x80)
-
-        state.left_trigger = self._report[4]
-        state.right_trigger = self._report[5]
-
-        state.left_joystick = (
-            struct.unpack("h", self._report[6:8])[0],  # x
-            struct.unpack("h", self._report[8:10])[0],  # y
-        )
-        state.right_joystick = (
-            struct.unpack("h", self._report[10:12])[0],  # x
-            struct.unpack("h", self._report[12:14])[0],  # y
-        )
+        super()._update_state(state)
+        r = self._report
+
+        state._set_left_trigger(r[4])
+        state._set_right_trigger(r[5])
+
+        left_x, left_y, right_x, right_y = struct.unpack_from("<hhhh", r, 6)
+        state._set_left_joystick(left_x, left_y)
+        state._set_right_joystick(right_x, right_y)
 
 
 class AdafruitSnesDevice(Device):
+    _BUTTON_LAYOUTS = (
+        (5, _ADAFRUIT_SNES_BUTTONS_5),
+        (6, _ADAFRUIT_SNES_BUTTONS_6),
+    )
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -847,24 +1179,36 @@ class AdafruitSnesDevice(Device):
         super().__init__(
             device, DEVICE_TYPE_ADAFRUIT_SNES, device_descriptor=device_descriptor, debug=debug
         )
+        if len(self._previous_report) >= 2:
+            self._previous_report[0:2] = b"\x7f\x7f"  # centered d-pad axes
 
     def _update_state(self, state: State) -> None:
-        state.buttons.LEFT = self._report[0] == 0x00
-        state.buttons.RIGHT = self._report[0] == 0xFF
-        state.buttons.UP = self._report[1] == 0x00
-        state.buttons.DOWN = self._report[1] == 0xFF
-
-        state.buttons.X = bool(self._report[5] & 0x10)
-        state.buttons.A = bool(self._report[5] & 0x20)
-        state.buttons.B = bool(self._report[5] & 0x40)
-        state.buttons.Y = bool(self._report[5] & 0x80)
-        state.buttons.L1 = bool(self._report[6] & 0x01)
-        state.buttons.R1 = bool(self._report[6] & 0x02)
-        state.buttons.SELECT = bool(self._report[6] & 0x10)
-        state.buttons.START = bool(self._report[6] & 0x20)
+        super()._update_state(state)
+        r = self._report
+        p = self._previous_report
+        r0, r1 = r[0], r[1]
+        b = state.buttons
+
+        # d-pad axes
+        if r0 != p[0]:
+            b._apply_mask(
+                (1 << BUTTON_LEFT) | (1 << BUTTON_RIGHT),
+                ((r0 == 0x00) << BUTTON_LEFT) | ((r0 == 0xFF) << BUTTON_RIGHT),
+            )
+        if r1 != p[1]:
+            b._apply_mask(
+                (1 << BUTTON_UP) | (1 << BUTTON_DOWN),
+                ((r1 == 0x00) << BUTTON_UP) | ((r1 == 0xFF) << BUTTON_DOWN),
+            )
 
 
 class Zero2Device(Device):  # 8BitDo
+    _BUTTON_LAYOUTS = (
+        (0, _ZERO2_BUTTONS_0),
+        (1, _ZERO2_BUTTONS_1),
+    )
+    _DPAD_INDEX = 2
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -875,24 +1219,14 @@ class Zero2Device(Device):  # 8BitDo
             device, DEVICE_TYPE_ADAFRUIT_SNES, device_descriptor=device_descriptor, debug=debug
         )
 
-    def _update_state(self, state: State) -> None:
-        state.buttons.A = bool(self._report[0] & 0x01)
-        state.buttons.B = bool(self._report[0] & 0x02)
-        state.buttons.X = bool(self._report[0] & 0x08)
-        state.buttons.Y = bool(self._report[0] & 0x10)
-        state.buttons.L1 = bool(self._report[0] & 0x40)
-        state.buttons.R1 = bool(self._report[0] & 0x80)
-        state.buttons.SELECT = bool(self._report[1] & 0x04)
-        state.buttons.START = bool(self._report[1] & 0x08)
-
-        # 4-bit BCD
-        state.buttons.UP = self._report[2] in {0x07, 0x00, 0x01}
-        state.buttons.RIGHT = self._report[2] in {0x01, 0x02, 0x03}
-        state.buttons.DOWN = self._report[2] in {0x03, 0x04, 0x05}
-        state.buttons.LEFT = self._report[2] in {0x05, 0x06, 0x07}
-
 
 class PowerAWiredDevice(Device):
+    _BUTTON_LAYOUTS = (
+        (0, _POWERA_WIRED_BUTTONS_0),
+        (1, _POWERA_WIRED_BUTTONS_1),
+    )
+    _DPAD_INDEX = 2
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -903,24 +1237,29 @@ class PowerAWiredDevice(Device):
             device, DEVICE_TYPE_POWERA_WIRED, device_descriptor=device_descriptor, debug=debug
         )
 
-    def _update_state(self, state: State) -> None:
-        state.buttons.Y = bool(self._report[0] & 0x01)
-        state.buttons.B = bool(self._report[0] & 0x02)
-        state.buttons.A = bool(self._report[0] & 0x04)
-        state.buttons.X = bool(self._report[0] & 0x08)
-        state.buttons.L1 = bool(self._report[0] & 0x10)
-        state.buttons.R1 = bool(self._report[0] & 0x20)
-        state.buttons.SELECT = bool(self._report[1] & 0x01)
-        state.buttons.START = bool(self._report[1] & 0x02)
-
-        # 4-bit BCD
-        state.buttons.UP = self._report[2] in {0x07, 0x00, 0x01}
-        state.buttons.RIGHT = self._report[2] in {0x01, 0x02, 0x03}
-        state.buttons.DOWN = self._report[2] in {0x03, 0x04, 0x05}
-        state.buttons.LEFT = self._report[2] in {0x05, 0x06, 0x07}
+
+class _ControlUpdate:
+    def __init__(self, device: Device):
+        self._device = device
+
+    def __enter__(self) -> Device:
+        self._device._control_batching += 1
+        return self._device
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._device._control_batching -= 1
+        if not self._device._control_batching and self._device._control_dirty:
+            self._device._flush_control()
 
 
 class DualShock4Device(Device):
+    _BUTTON_LAYOUTS = (
+        (5, _DS4_BUTTONS_5),  # Square, X, Circle, Triangle
+        (6, _DS4_BUTTONS_6),  # L1, R1, Share, Options, L3, R3
+        (7, _DS4_BUTTONS_7),  # PS, Touch Pad
+    )
+    _DPAD_INDEX = 5
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -928,6 +1267,8 @@ class DualShock4Device(Device):
         debug: bool = False,
     ):
         # identify interface index
+        if device_descriptor is None:
+            device_descriptor = DeviceDescriptor(device)
         for index, interface in enumerate(device_descriptor.configurations[0].interfaces):
             if interface.get_class_identifier() == (0x03, 0x00):
                 break
@@ -941,16 +1282,35 @@ class DualShock4Device(Device):
         )
 
         self._color = 0
+        self._color_bytes = bytes(3)
         self._rumble = 0.0
+        self._rumble_bytes = bytes(2)
         self._flash = 0.0
+        self._flash_bytes = bytes(2)
+
+        self._control_msg = bytearray(32)
+        self._control_msg[0] = 0x05
+        self._control_msg[1] = 0xFF
+        self._control_dirty = False
+        self._control_batching = 0
+
+    def control_update(self) -> _ControlUpdate:
+        """Group changes to :attr:`led`, :attr:`color`, :attr:`rumble` and :attr:`flash` within a
+        ``with`` block into a single control report which is sent when the block exits.
+        """
+        return _ControlUpdate(self)
 
     def _update_control(self) -> None:
-        msg = bytearray(32)
-        msg[0] = 0x05
-        msg[1] = 0xFF
-        msg[4:6] = bytearray([int(self._rumble * 255) & 0xFF] * 2)
-        msg[6:9] = bytearray([(self._color >> ((2 - i) * 8)) & 0xFF for i in range(3)])
-        msg[9:11] = bytearray([int(self._flash / 2.5 * 255) & 0xFF] * 2)
+        self._control_dirty = True
+        if not self._control_batching:
+            self._flush_control()
+
+    def _flush_control(self) -> None:
+        msg = self._control_msg
+        msg[4:6] = self._rumble_bytes
+        msg[6:9] = self._color_bytes
+        msg[9:11] = self._flash_bytes
+        self._control_dirty = False
         self.write(msg)
 
     @property
@@ -963,6 +1323,7 @@ class DualShock4Device(Device):
             value = 0
         self._led = min(max(value, 0), len(_DS4_COLORS))
         self._color = _DS4_COLORS[self._led]
+        self._color_bytes = self._color.to_bytes(3, "big")
         self._update_control()
 
     @property
@@ -972,6 +1333,7 @@ class DualShock4Device(Device):
     @color.setter
     def color(self, value: int) -> None:
         self._color = value & 0xFFFFFF
+        self._color_bytes = self._color.to_bytes(3, "big")
         self._led = 0
         self._update_control()
 
@@ -982,6 +1344,7 @@ class DualShock4Device(Device):
     @rumble.setter
     def rumble(self, value: float) -> None:
         self._rumble = value
+        self._rumble_bytes = bytes((int(value * 255) & 0xFF,) * 2)
         self._update_control()
 
     @property
@@ -991,46 +1354,31 @@ class DualShock4Device(Device):
     @flash.setter
     def flash(self, value: float) -> None:
         self._flash = value
+        self._flash_bytes = bytes((int(value / 2.5 * 255) & 0xFF,) * 2)
         self._update_control()
 
     def _update_state(self, state: State) -> None:
-        state.left_joystick = (
-            (self._report[1] - 128) << 8,  # x
-            (128 - self._report[2]) << 8,  # y
+        super()._update_state(state)
+        r = self._report
+
+        state._set_left_joystick(
+            (r[1] - 128) << 8,  # x
+            (128 - r[2]) << 8,  # y
         )
-        state.right_joystick = (
-            (self._report[3] - 128) << 8,  # x
-            (128 - self._report[4]) << 8,  # y
+        state._set_right_joystick(
+            (r[3] - 128) << 8,  # x
+            (128 - r[4]) << 8,  # y
         )
 
-        state.buttons.Y = bool(self._report[5] & 0x80)  # Triangle
-        state.buttons.B = bool(self._report[5] & 0x40)  # Circle
-        state.buttons.A = bool(self._report[5] & 0x20)  # X
-        state.buttons.X = bool(self._report[5] & 0x10)  # Square
-
-        # 4-bit BCD for d-pad
-        state.buttons.UP = self._report[5] in {0x07, 0x00, 0x01}
-        state.buttons.RIGHT = self._report[5] in {0x01, 0x02, 0x03}
-        state.buttons.DOWN = self._report[5] in {0x03, 0x04, 0x05}
-        state.buttons.LEFT = self._report[5] in {0x05, 0x06, 0x07}
-
-        state.buttons.L1 = bool(self._report[6] & 0x01)
-        state.buttons.R1 = bool(self._report[6] & 0x02)
-        # state.buttons.L2 = bool(self._report[6] & 0x04)  # handled by analog trigger values
-        # state.buttons.R2 = bool(self._report[6] & 0x08)
-        state.buttons.SELECT = bool(self._report[6] & 0x10)  # Share
-        state.buttons.START = bool(self._report[6] & 0x20)  # Options
-        state.buttons.L3 = bool(self._report[6] & 0x40)
-        state.buttons.R3 = bool(self._report[6] & 0x80)
-
-        state.buttons.HOME = bool(self._report[7] & 0x01)  # PS
-        state.buttons.TOUCH_PAD = bool(self._report[7] & 0x02)  # Touch Pad
-
-        state.left_trigger = self._report[8]
-        state.right_trigger = self._report[9]
+        state._set_left_trigger(r[8])
+        state._set_right_trigger(r[9])
 
 
 class HIDJoystickDevice(Device):
+    # TODO: automatic button mapping depending on pid+vid
+    _BUTTON_LAYOUTS = ((8, _HID_JOYSTICK_BUTTONS_8),)
+    _DPAD_INDEX = 7
+
     def __init__(
         self,
         device: usb.core.Device,
@@ -1041,79 +1389,63 @@ class HIDJoystickDevice(Device):
             device, DEVICE_TYPE_HID_JOYSTICK, device_descriptor=device_descriptor, debug=debug
         )
 
-    @staticmethod
-    def _int8(value):
-        return value - 256 if value > 127 else value
+    def _update_state(self, state: State) -> None:
+        super()._update_state(state)
+        r = self._report
 
-    @staticmethod
-    def _int10(data):
-        value = data[0] | ((data[1] & 3) << 8)
-        return value - 1024 if value > 511 else value
+        state._set_right_trigger(r[6] << 1)  # throttle
 
-    def _update_state(self, state: State) -> None:
-        # TODO: automatic button mapping depending on pid+vid
-        state.buttons.R1 = bool(self._report[8] & 0x01)  # button 1 (trigger)
-        state.buttons.L1 = bool(self._report[8] & 0x02)  # button 2
-        state.buttons.SELECT = bool(self._report[8] & 0x04)  # button 3
-        state.buttons.START = bool(self._report[8] & 0x08)  # button 4
-        state.buttons.A = bool(self._report[8] & 0x10)  # button 5
-        state.buttons.X = bool(self._report[8] & 0x20)  # button 6
-        state.buttons.Y = bool(self._report[8] & 0x40)  # button 7
-        state.buttons.B = bool(self._report[8] & 0x80)  # button 8
-
-        # 4-bit BCD (hat switch)
-        state.buttons.UP = self._report[7] in {0x07, 0x00, 0x01}
-        state.buttons.RIGHT = self._report[7] in {0x01, 0x02, 0x03}
-        state.buttons.DOWN = self._report[7] in {0x03, 0x04, 0x05}
-        state.buttons.LEFT = self._report[7] in {0x05, 0x06, 0x07}
-
-        state.right_trigger = self._report[6] << 1  # throttle
-
-        state.left_joystick = (
-            self._int10(self._report[1:3]) << 6,  # x
-            self._int10(self._report[3:5]) << 6,  # y
+        # signed 10-bit x & y axes
+        x = (r[1] | (r[2] << 8)) & 0x03FF
+        y = (r[3] | (r[4] << 8)) & 0x03FF
+        state._set_left_joystick(
+            (x - ((x & 0x0200) << 1)) << 6,  # x
+            (y - ((y & 0x0200) << 1)) << 6,  # y
         )
-        state.right_joystick = (
-            self._int8(self._report[5]) << 10,  # z / twist / rudder
+        state._set_right_joystick(
+            ((r[5] ^ 0x80) - 0x80) << 10,  # signed 8-bit z / twist / rudder
             0,  # y
         )
 
 
-def _create_device(  # noqa: PLR0911
+_DEVICE_CONSTRUCTORS = {
+    # device type: device class,
+    DEVICE_TYPE_SWITCH_PRO: SwitchProDevice,
+    DEVICE_TYPE_XINPUT: XInputDevice,
+    DEVICE_TYPE_ADAFRUIT_SNES: AdafruitSnesDevice,
+    DEVICE_TYPE_8BITDO_ZERO2: Zero2Device,
+    DEVICE_TYPE_POWERA_WIRED: PowerAWiredDevice,
+    DEVICE_TYPE_PLAYSTATION_DS4: DualShock4Device,
+    DEVICE_TYPE_HID_JOYSTICK: HIDJoystickDevice,
+}
+
+
+def _create_device(
     device: usb.core.Device,
     device_type: int,
     device_descriptor: DeviceDescriptor = None,
     debug: bool = False,
 ):
-    if device_type == DEVICE_TYPE_SWITCH_PRO:
-        return SwitchProDevice(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_XINPUT:
-        return XInputDevice(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_ADAFRUIT_SNES:
-        return AdafruitSnesDevice(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_8BITDO_ZERO2:
-        return Zero2Device(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_POWERA_WIRED:
-        return PowerAWiredDevice(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_PLAYSTATION_DS4:
-        return DualShock4Device(device, device_descriptor=device_descriptor, debug=debug)
-    elif device_type == DEVICE_TYPE_HID_JOYSTICK:
-        return HIDJoystickDevice(device, device_descriptor=device_descriptor, debug=debug)
-    else:
+    try:
+        device_class = _DEVICE_CONSTRUCTORS[device_type]
+    except KeyError:
         raise ValueError("Unknown device type")
+    return device_class(device, device_descriptor=device_descriptor, debug=debug)
 
 
-_connected_devices = []
-_failed_devices = []
+_connected_devices = set()
+_failed_devices = set()
 
 
 def _find_device(port: int = None, debug: bool = False) -> Device:  # noqa: PLR0912
     for device in usb.core.find(find_all=True):
         try:
-            device_id = (device.idVendor, device.idProduct)
+            vid, pid = device.idVendor, device.idProduct
         except usb.core.USBError:
             continue
-        if (port,) + device_id in _connected_devices or device_id in _failed_devices:
+        device_id = (vid, pid)
+        connected_id = (port, vid, pid)
+        if connected_id in _connected_devices or device_id in _failed_devices:
             continue
 
         if port is not None:
@@ -1143,7 +1475,7 @@ def _find_device(port: int = None, debug: bool = False) -> Device:  # noqa: PLR0
         except usb.core.USBError as e:
             if debug:
                 print(f"unable to read device descriptor: {str(e)}")
-            _failed_devices.append(device_id)
+            _failed_devices.add(device_id)
             continue
 
         if (
@@ -1153,15 +1485,12 @@ def _find_device(port: int = None, debug: bool = False) -> Device:  # noqa: PLR0
         ) == DEVICE_TYPE_UNKNOWN:
             if debug:
                 print("device not recognized")
-            _failed_devices.append(device_id)
+            _failed_devices.add(device_id)
             continue
         elif debug:
-            try:
-                print(
-                    "device identified:",
-                    next((name for i, name in enumerate(DEVICE_NAMES) if i == device_type)),
-                )
-            except StopIteration:
+            if device_type < len(DEVICE_NAMES):
+                print("device identified:", DEVICE_NAMES[device_type])
+            else:
                 print("unknown device name of recognized device type")
 
         try:
@@ -1171,12 +1500,12 @@ def _find_device(port: int = None, debug: bool = False) -> Device:  # noqa: PLR0
             # set player led (if supported)
             gamepad_device.led = port
 
-            _connected_devices.append((port,) + device_id)
+            _connected_devices.add(connected_id)
             return gamepad_device
         except ValueError as e:
             if debug:
                 print(f"failed to initialize device: {str(e)}")
-            _failed_devices.append(device_id)
+            _failed_devices.add(device_id)
 
 
 class Gamepad:
@@ -1184,7 +1513,18 @@ class Gamepad:
     supported USB gamepad devices.
     """
 
-    def __init__(self, port: int = None, debug: bool = False) -> None:
+    __slots__ = (
+        "_port",
+        "_debug",
+        "_poll_interval",
+        "_device",
+        "_device_id",
+        "_state",
+        "_timeouts",
+        "_timestamp",
+    )
+
+    def __init__(self, port: int = None, debug: bool = False, poll_interval: int = None) -> None:
         """Initializes the :class:`Gamepad` device helper.
 
         :param port: If using a USB hub such as the CH334F, you can specify the desired physical
@@ -1192,9 +1532,14 @@ class Gamepad:
             a specific device location for each. Use `None` to allow this class to communicate with
             devices on any USB port.
         :param debug: Set this value to `True` to generate verbose debug messages over REPL.
+        :param poll_interval: The minimum time in milliseconds between reads of the device. Use
+            `None` to poll at the interval advertised by the device's endpoints. Lowering this value
+            reduces input latency at the cost of more time spent on USB transfers, but reports are
+            only ever as fresh as the rate at which :meth:`update` is called.
         """
         self._port = port
         self._debug = debug
+        self._poll_interval = poll_interval
 
         self._device = None
         self._device_id = None
@@ -1212,18 +1557,22 @@ class Gamepad:
         :return: Whether or not the state of the gamepad was updated.
         """
         # reset button changes
-        self._state._buttons._changed = 0
-
-        if self._device is None and time.monotonic() - self._timestamp >= _SEARCH_DELAY:
-            self._device = _find_device(self._port, debug=self._debug)
-            if self._device is not None:
-                self._device_id = self._device.device_id
-            self._timestamp = time.monotonic()
-        if self._device is None:
-            return False
+        state = self._state
+        state._buttons._changed = 0
+
+        if (device := self._device) is None:
+            if (current_time := time.monotonic()) - self._timestamp < _SEARCH_DELAY:
+                return False
+            self._timestamp = current_time
+            device = self._device = _find_device(self._port, debug=self._debug)
+            if device is None:
+                return False
+            self._device_id = device.device_id
+            if self._poll_interval is not None:
+                device.poll_interval = self._poll_interval
 
         try:
-            return self._device.read_state(self._state)
+            return device.read_state(state)
         except usb.core.USBTimeoutError:
             self._timeouts += 1
             if self._timeouts > _MAX_TIMEOUTS:
@@ -1379,8 +1728,9 @@ class Gamepad:
             return False
         if self._debug:
             print("disconnecting from device:", self._device_id)
-        if (self._port,) + self._device_id in _connected_devices:
-            _connected_devices.remove((self._port,) + self._device_id)
+        vid, pid = self._device_id
+        _connected_devices.discard((self._port, vid, pid))
+        self._device.release()
         del self._device
         self._device = None
         self._device_id = None
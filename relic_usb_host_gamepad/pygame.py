@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2026 Cooper Dalrymple
 #
 # SPDX-License-Identifier: MIT
+import math
+
 import pygame
+from pygame import JOYAXISMOTION, JOYBUTTONDOWN, JOYBUTTONUP, JOYHATMOTION
 
 import relic_usb_host_gamepad
 from relic_usb_host_gamepad import (
@@ -30,10 +33,10 @@ from relic_usb_host_gamepad import (
 )
 
 EVENT_TYPES = (
-    pygame.JOYBUTTONDOWN,
-    pygame.JOYBUTTONUP,
-    pygame.JOYAXISMOTION,
-    pygame.JOYHATMOTION,
+    JOYBUTTONDOWN,
+    JOYBUTTONUP,
+    JOYAXISMOTION,
+    JOYHATMOTION,
 )
 """All the event types supported within :meth:`Gamepad.process_event`.
 """
@@ -147,6 +150,13 @@ _JOYSTICK_HATS = {
     ),
 }
 
+_JOYSTICK_X_BUTTONS = frozenset((BUTTON_JOYSTICK_LEFT, BUTTON_JOYSTICK_RIGHT))
+
+# axis kinds
+_AXIS_NONE = 0
+_AXIS_TRIGGER = 1  # single button
+_AXIS_BUTTONS = 2  # negative & positive button pair
+
 _JOYSTICK_AXES = {
     "Xbox 360 Controller": (
         (BUTTON_JOYSTICK_LEFT, BUTTON_JOYSTICK_RIGHT),
@@ -184,6 +194,22 @@ class Gamepad(relic_usb_host_gamepad.Gamepad):
     the :class:`relic_usb_host_gamepad.Gamepad` API.
     """
 
+    __slots__ = (
+        "_joystick",
+        "_get_axis",
+        "_name",
+        "_axes",
+        "_hats",
+        "_button_map",
+        "_axis_map",
+        "_hat_map",
+        "_axis_kinds",
+        "_joystick_axes",
+        "_trigger_threshold",
+        "_joystick_threshold",
+        "_joystick_threshold_negative",
+    )
+
     def __init__(self, id: int = 0, debug: bool = False):
         """Initializes the :class:`Gamepad` device helper.
 
@@ -203,13 +229,51 @@ class Gamepad(relic_usb_host_gamepad.Gamepad):
             raise ValueError("Invalid joystick id requested")
 
         self._joystick = pygame.joystick.Joystick(id)
+        self._get_axis = self._joystick.get_axis
         self._name = self._joystick.get_name()
 
         if not is_joystick_supported(self._name):
             raise NotImplementedError(f'Joystick of type "{self._name:s}" not supported')
 
         self._axes = [0] * self._joystick.get_numaxes()
-        self._hats = [0] * self._joystick.get_numhats()
+        self._hats = [(0, 0)] * self._joystick.get_numhats()
+
+        # resolve device mappings
+        self._button_map = _JOYSTICK_BUTTONS.get(self._name, ())
+        self._axis_map = _JOYSTICK_AXES.get(self._name, ())
+        self._hat_map = _JOYSTICK_HATS.get(self._name, ())
+
+        # cache normalized thresholds for axis events without writing them back to the state
+        self._trigger_threshold = self._state.trigger_threshold
+        self._joystick_threshold = self._state.joystick_threshold
+        self._joystick_threshold_negative = -self._joystick_threshold
+
+        # classify each mapped axis once
+        self._axis_kinds = tuple(
+            _AXIS_TRIGGER
+            if isinstance(axis, int)
+            else (_AXIS_BUTTONS if isinstance(axis, tuple) else _AXIS_NONE)
+            for axis in self._axis_map
+        )
+
+        # left joystick axes as (index, is y axis)
+        self._joystick_axes = tuple(
+            (i, axis[0] == BUTTON_JOYSTICK_UP)
+            for i, axis in enumerate(self._axis_map)
+            if isinstance(axis, tuple)
+            and (axis[0] in _JOYSTICK_X_BUTTONS or axis[0] == BUTTON_JOYSTICK_UP)
+        )
+
+    @relic_usb_host_gamepad.Gamepad.trigger_threshold.setter
+    def trigger_threshold(self, value: int | float) -> None:
+        self._state.trigger_threshold = value
+        self._trigger_threshold = self._state.trigger_threshold
+
+    @relic_usb_host_gamepad.Gamepad.joystick_threshold.setter
+    def joystick_threshold(self, value: int | float) -> None:
+        self._state.joystick_threshold = value
+        self._joystick_threshold = self._state.joystick_threshold
+        self._joystick_threshold_negative = -self._joystick_threshold
 
     def update(self) -> bool:
         """Update the gamepad device.
@@ -217,8 +281,15 @@ class Gamepad(relic_usb_host_gamepad.Gamepad):
         :return: Whether or not the state of the gamepad was updated.
         :rtype: bool
         """
-        self.update_axes()
-        return self.process_events(pygame.event.get(eventtype=EVENT_TYPES))
+        if self._joystick_axes:
+            self.update_axes()
+
+        # avoid allocating an empty event list on idle frames
+        if not pygame.event.peek(eventtype=EVENT_TYPES):
+            self.reset_button_changes()
+            return False
+
+        return self.process_events(pygame.event.get(eventtype=EVENT_TYPES, pump=False))
 
     def disconnect(self) -> bool:
         """Calls :meth:`pygame.joystick.Joystick.quit`.
@@ -256,97 +327,105 @@ class Gamepad(relic_usb_host_gamepad.Gamepad):
         :return: Whether or not the state of a button was changed.
         :rtype: bool
         """
-        if event.type not in EVENT_TYPES:
+        if (handler := _EVENT_HANDLERS.get(event.type)) is None:
             return False
 
         if event.instance_id != self._joystick.get_instance_id():
             return False
 
-        changed = False
+        return handler(self, event)
 
+    def _process_button_event(self, event: pygame.event.Event) -> bool:
         if (
-            event.type in {pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP}
-            and self._name in _JOYSTICK_BUTTONS
-            and event.button < len(_JOYSTICK_BUTTONS[self._name])
+            event.button >= len(self._button_map)
+            or (button := self._button_map[event.button]) is None
         ):
-            self._state.buttons[_JOYSTICK_BUTTONS[self._name][event.button]] = (
-                event.type == pygame.JOYBUTTONDOWN
+            return False
+
+        self._state.buttons._apply_mask(1 << button, (event.type == JOYBUTTONDOWN) << button)
+        return True
+
+    def _process_axis_event(self, event: pygame.event.Event) -> bool:
+        if (index := event.axis) >= len(self._axis_map):
+            return False
+
+        kind = self._axis_kinds[index]
+        previous = self._axes[index]
+        if kind == _AXIS_TRIGGER:
+            value = 1 if event.value >= self._trigger_threshold else 0
+            if value == previous:
+                return False
+            button = self._axis_map[index]
+            self._state.buttons._apply_mask(1 << button, value << button)
+        elif kind == _AXIS_BUTTONS:
+            value = (
+                1
+                if event.value >= self._joystick_threshold
+                else (-1 if event.value <= self._joystick_threshold_negative else 0)
             )
-            changed = True
+            if not self._apply_direction(self._axis_map[index], previous, value):
+                return False
+        else:
+            return False
 
-        elif (
-            event.type == pygame.JOYAXISMOTION
-            and self._name in _JOYSTICK_AXES
-            and event.axis < len(_JOYSTICK_AXES[self._name])
-        ):
-            axis = _JOYSTICK_AXES[self._name][event.axis]
-            if (
-                isinstance(axis, int)
-                and (value := int(event.value >= self.trigger_threshold)) != self._axes[event.axis]
-            ):
-                self._state.buttons[axis] = value
-                self._axes[event.axis] = value
-                changed = True
-            elif (
-                isinstance(axis, tuple)
-                and (
-                    value := (
-                        1
-                        if event.value >= self.joystick_threshold
-                        else (-1 if event.value <= -self.joystick_threshold else 0)
-                    )
-                )
-                != self._axes[event.axis]
-            ):
-                if self._axes[event.axis] != 0:
-                    self._state.buttons[axis[int(self._axes[event.axis] > 0)]] = False
-                    changed = True
-                if value != 0:
-                    self._state.buttons[axis[int(value > 0)]] = True
-                    changed = True
-                self._axes[event.axis] = value
-
-        elif (
-            event.type == pygame.JOYHATMOTION
-            and self._name in _JOYSTICK_HATS
-            and event.hat < len(_JOYSTICK_HATS[self._name])
-            and _JOYSTICK_HATS[self._name][event.hat] is not None
-        ):
-            if self._hats[event.hat] != 0:
-                self._state.buttons[
-                    _JOYSTICK_HATS[self._name][event.hat][int(self._hats[event.hat] > 0)]
-                ] = False
-                changed = True
-            if event.value != 0:
-                self._state.buttons[_JOYSTICK_HATS[self._name][event.hat][int(event.value > 0)]] = (
-                    True
-                )
-                changed = True
-            self._hats[event.hat] = event.value
+        self._axes[index] = value
+        return True
 
-        return changed
+    def _process_hat_event(self, event: pygame.event.Event) -> bool:
+        # only the first hat is mapped as (x buttons, y buttons)
+        if event.hat != 0 or not self._hat_map:
+            return False
+
+        x, y = event.value
+        previous_x, previous_y = self._hats[0]
+        self._hats[0] = (x, y)
+        changed = self._apply_direction(self._hat_map[0], previous_x, x)
+        return self._apply_direction(self._hat_map[1], previous_y, y) or changed
+
+    def _apply_direction(self, buttons: tuple, previous: int, value: int) -> bool:
+        # release and press a (negative, positive) button pair in one update
+        if value == previous:
+            return False
+        self._state.buttons._apply_mask(
+            (1 << buttons[0]) | (1 << buttons[1]),
+            (1 << buttons[1 if value > 0 else 0]) if value else 0,
+        )
+        return True
 
     def update_axes(self) -> bool:
         """Updates the values of :prop:`Gamepad.left_joystick` and :prop:`Gamepad.right_joystick` if
-        they are supported by the device.
+        they are supported by the device. The axes respect the joystick invert settings, but the
+        joystick direction buttons are only derived from axis events within :meth:`process_events`.
 
         :return: Whether or not the gamepad's joysticks were updated.
         :rtype: bool
         """
-        if self._name not in _JOYSTICK_AXES:
+        if not self._joystick_axes:
             return False
 
-        for i, axis in enumerate(_JOYSTICK_AXES[self._name]):
-            if isinstance(axis, tuple):
-                if axis[0] in {BUTTON_JOYSTICK_LEFT, BUTTON_JOYSTICK_RIGHT}:
-                    self._state._left_joystick_x = self._apply_deadzone(
-                        self._joystick.get_axis(i), axis[0] == BUTTON_JOYSTICK_RIGHT
-                    )[0]
-
-                elif axis[0] == BUTTON_JOYSTICK_DOWN:
-                    self._state._left_joystick_y = self._apply_deadzone(
-                        self._joystick.get_axis(i), axis[0] == BUTTON_JOYSTICK_DOWN
-                    )[0]
+        x = y = 0.0
+        get_axis = self._get_axis
+        for i, is_y in self._joystick_axes:
+            if is_y:
+                y = -get_axis(i)  # pygame y axes are positive downward
+            else:
+                x = get_axis(i)
+
+        state = self._state
+        if state.left_joystick_invert_x:
+            x = -x
+        if state.left_joystick_invert_y:
+            y = -y
+
+        # radial deadzone so that small diagonal movements are ignored as a whole
+        deadzone = state.joystick_deadzone
+        if (magnitude := math.hypot(x, y)) <= deadzone or deadzone >= 1.0:
+            state._left_joystick_x = state._left_joystick_y = 0
+        else:
+            scale = (min(magnitude, 1.0) - deadzone) / ((1.0 - deadzone) * magnitude) * 32767
+            # |x|, |y| <= magnitude, so the scaled axes already lie within range
+            state._left_joystick_x = int(x * scale)
+            state._left_joystick_y = int(y * scale)
 
         return True
 
@@ -355,3 +434,12 @@ class Gamepad(relic_usb_host_gamepad.Gamepad):
         this method will need to be called to ensure that button change states are properly handled.
         """
         self._state._buttons._changed = 0
+
+
+# event type => Gamepad event handler
+_EVENT_HANDLERS = {
+    JOYBUTTONDOWN: Gamepad._process_button_event,
+    JOYBUTTONUP: Gamepad._process_button_event,
+    JOYAXISMOTION: Gamepad._process_axis_event,
+    JOYHATMOTION: Gamepad._process_hat_event,
+}